@@ -1,6 +1,7 @@
-from .validators import (ValidationError, is_border_spacing, is_color,
-                         is_integer, is_length, is_number, is_percentage,
-                         is_quote, is_rect)
+from .validators import (INVALID, description_of, is_border_spacing,
+                         is_color, is_integer, is_length, is_number,
+                         is_percentage, is_quote, is_rect,
+                         passthrough_types_of, try_validator)
 
 
 class Choices:
@@ -12,17 +13,36 @@ class Choices:
         self.explicit_defaulting_constants = explicit_defaulting_constants or []
         self.validators = validators or []
 
-    def validate(self, value):
+        # Map each constant to itself, so a hashable value is matched with a
+        # single lookup (an identity check for the usual keyword strings)
+        self._constant_lookup = {const: const for const in self.explicit_defaulting_constants}
+        self._constant_lookup.update((const, const) for const in self.constants)
+
+        self._try_validators = [try_validator(validator) for validator in self.validators]
+
+        # Types any of the validators accept without conversion
+        passthrough_types = []
         for validator in self.validators:
-            try:
-                value = validator(value)
-                return value
-            except ValidationError:
-                pass
+            passthrough_types.extend(passthrough_types_of(validator))
+        self.passthrough_types = tuple(passthrough_types)
+
+    def validate(self, value):
+        for validator in self._try_validators:
+            result = validator(value)
+            if result is not INVALID:
+                return result
 
         if value == 'none':
             value = None
 
+        try:
+            return self._constant_lookup[value]
+        except KeyError:
+            raise ValueError() from None
+        except TypeError:
+            # Unhashable value; fall back to comparing against each constant
+            pass
+
         for const in self.constants:
             if value == const:
                 return const
@@ -36,7 +56,7 @@ class Choices:
     def __str__(self):
         choices = set([str(c).lower().replace('_', '-') for c in self.constants])
         for validator in self.validators:
-            choices.add(validator.description)
+            choices.add(description_of(validator))
 
         if self.explicit_defaulting_constants:
             for item in self.explicit_defaulting_constants:
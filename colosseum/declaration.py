@@ -28,6 +28,18 @@ from .wrappers import Outline
 
 _CSS_PROPERTIES = set()
 
+# The attribute name, choices and initial value of each validated property,
+# so that CSS.update() can validate values without going through the setters
+_CSS_PROPERTY_CHOICES = {}
+
+# The properties each directional or shorthand property stands for, and the
+# function converting one of its values into a dictionary of their values.
+# Properties left out of the dictionary are reset to their initial value.
+_CSS_PROPERTY_EXPANSIONS = {}
+
+# Marks a property to be reset to its initial value by CSS.update()
+_RESET = object()
+
 
 def validated_shorthand_property(name, parser, wrapper):
     """Define the shorthand CSS font property."""
@@ -43,13 +55,16 @@ def validated_shorthand_property(name, parser, wrapper):
         # This is the only place we use the wrapper as a convenience for the user
         return wrapper(**properties) if properties else ''
 
-    def setter(self, value):
+    def expand(value):
         try:
             # A shorthand parser must return a dictionary
-            shorthand_dict = parser(value)
+            return parser(value)
         except ValidationError:
             raise ValueError("Invalid value '%s' for CSS property '%s'!" % (value, name))
 
+    def setter(self, value):
+        shorthand_dict = expand(value)
+
         # Reset non declared properties to initial values
         used_properties = shorthand_dict.keys()
         for property_name in wrapper.VALID_KEYS:
@@ -72,6 +87,7 @@ def validated_shorthand_property(name, parser, wrapper):
                 pass
 
     _CSS_PROPERTIES.add(name)
+    _CSS_PROPERTY_EXPANSIONS[name] = (wrapper.VALID_KEYS, expand)
     return property(getter, setter, deleter)
 
 
@@ -116,6 +132,8 @@ def validated_property(name, choices, initial):
         except AttributeError:
             raise ValueError('Initial value "%s" does not have a value attribute!' % initial)
 
+    attr_name = '_%s' % name
+
     def getter(self):
         try:
             # Get initial value from other property value. See OtherProperty.
@@ -123,29 +141,40 @@ def validated_property(name, choices, initial):
         except AttributeError:
             initial_value = initial
 
-        return getattr(self, '_%s' % name, initial_value)
+        return getattr(self, attr_name, initial_value)
 
     def setter(self, value):
+        current = getattr(self, attr_name, initial)
+
+        # An already converted value is compared before validation, so a no-op
+        # assignment skips validation and a changed one isn't compared twice
+        known_changed = False
+        if isinstance(value, choices.passthrough_types):
+            if value == current:
+                return
+            known_changed = True
+
         try:
-            value = choices.validate(value)
+            validated = choices.validate(value)
         except ValueError:
             raise ValueError("Invalid value '%s' for CSS property '%s'; Valid values are: %s" % (
                 value, name, choices
             ))
 
-        if value != getattr(self, '_%s' % name, initial):
-            setattr(self, '_%s' % name, value)
+        if (known_changed and validated is value) or validated != current:
+            setattr(self, attr_name, validated)
             self.dirty = True
 
     def deleter(self):
         try:
-            delattr(self, '_%s' % name)
+            delattr(self, attr_name)
             self.dirty = True
         except AttributeError:
             # Attribute doesn't exist
             pass
 
     _CSS_PROPERTIES.add(name)
+    _CSS_PROPERTY_CHOICES[name] = (attr_name, choices, initial)
     return property(getter, setter, deleter)
 
 
@@ -159,35 +188,30 @@ def directional_property(name, initial):
             getattr(self, name % '_left', initial),
         )
 
-    def setter(self, value):
+    property_names = (name % '_top', name % '_right', name % '_bottom', name % '_left')
+
+    def expand(value):
         if isinstance(value, tuple):
             if len(value) == 4:
-                setattr(self, name % '_top', value[0])
-                setattr(self, name % '_right', value[1])
-                setattr(self, name % '_bottom', value[2])
-                setattr(self, name % '_left', value[3])
+                top, right, bottom, left = value
             elif len(value) == 3:
-                setattr(self, name % '_top', value[0])
-                setattr(self, name % '_right', value[1])
-                setattr(self, name % '_bottom', value[2])
-                setattr(self, name % '_left', value[1])
+                top, right, bottom = value
+                left = right
             elif len(value) == 2:
-                setattr(self, name % '_top', value[0])
-                setattr(self, name % '_right', value[1])
-                setattr(self, name % '_bottom', value[0])
-                setattr(self, name % '_left', value[1])
+                top = bottom = value[0]
+                right = left = value[1]
             elif len(value) == 1:
-                setattr(self, name % '_top', value[0])
-                setattr(self, name % '_right', value[0])
-                setattr(self, name % '_bottom', value[0])
-                setattr(self, name % '_left', value[0])
+                top = right = bottom = left = value[0]
             else:
                 raise ValueError("Invalid value for '%s'; value must be an number, or a 1-4 tuple." % (name % ''))
         else:
-            setattr(self, name % '_top', value)
-            setattr(self, name % '_right', value)
-            setattr(self, name % '_bottom', value)
-            setattr(self, name % '_left', value)
+            top = right = bottom = left = value
+
+        return dict(zip(property_names, (top, right, bottom, left)))
+
+    def setter(self, value):
+        for property_name, property_value in expand(value).items():
+            setattr(self, property_name, property_value)
 
     def deleter(self):
         delattr(self, name % '_top')
@@ -200,6 +224,7 @@ def directional_property(name, initial):
     _CSS_PROPERTIES.add(name % '_right')
     _CSS_PROPERTIES.add(name % '_bottom')
     _CSS_PROPERTIES.add(name % '_left')
+    _CSS_PROPERTY_EXPANSIONS[name % ''] = (property_names, expand)
     return property(getter, setter, deleter)
 
 
@@ -519,15 +544,58 @@ class CSS:
     ######################################################################
     def update(self, **styles):
         "Set multiple styles on the CSS definition."
+        # Every name and value is checked before anything is modified, so an
+        # invalid style leaves the declaration untouched
+        property_values = []
         for name, value in styles.items():
             name = name.replace('-', '_')
-            if name not in _CSS_PROPERTIES:
+            if name in _CSS_PROPERTY_EXPANSIONS:
+                property_names, expand = _CSS_PROPERTY_EXPANSIONS[name]
+                expanded = {} if value is None else expand(value)
+                for property_name in property_names:
+                    property_values.append((property_name, expanded.get(property_name, _RESET)))
+            elif name in _CSS_PROPERTIES:
+                property_values.append((name, _RESET if value is None else value))
+            else:
                 raise NameError("Unknown CSS style '%s'" % name)
 
-            if value is None:
-                delattr(self, name)
-            else:
-                setattr(self, name, value)
+        changes = []
+        for name, value in property_values:
+            validated_property = _CSS_PROPERTY_CHOICES.get(name)
+            if validated_property is not None and value is not _RESET:
+                choices = validated_property[1]
+                try:
+                    value = choices.validate(value)
+                except ValueError:
+                    raise ValueError("Invalid value '%s' for CSS property '%s'; Valid values are: %s" % (
+                        value, name, choices
+                    ))
+            changes.append((name, value, validated_property))
+
+        dirty = False
+        for name, value, validated_property in changes:
+            if validated_property is None:
+                # Not a validated property; there is no setter to bypass
+                if value is _RESET:
+                    delattr(self, name)
+                else:
+                    setattr(self, name, value)
+                continue
+
+            attr_name, _, initial = validated_property
+            if value is _RESET:
+                try:
+                    delattr(self, attr_name)
+                    dirty = True
+                except AttributeError:
+                    # Attribute doesn't exist
+                    pass
+            elif value != getattr(self, attr_name, initial):
+                setattr(self, attr_name, value)
+                dirty = True
+
+        if dirty:
+            self.dirty = True
 
     def copy(self, node=None):
         "Create a duplicate of this style declaration."
@@ -2,4 +2,47 @@
 
 
 class ValidationError(ValueError):
-    pass
+    """
+    A value is not valid for a CSS property.
+
+    Use from_template() to defer formatting the message until the error is
+    first inspected; from then on it behaves as if built with the message.
+    """
+    _template = None
+    _template_args = ()
+
+    @classmethod
+    def from_template(cls, template, *args):
+        """Create an error whose message is the %-style template applied to args."""
+        error = cls()
+        error._template = template
+        error._template_args = args
+        return error
+
+    def _format_template(self):
+        if self._template is not None:
+            message = self._template % self._template_args
+            self._template = None
+            ValueError.args.__set__(self, (message, ))
+
+    @property
+    def args(self):
+        self._format_template()
+        return ValueError.args.__get__(self)
+
+    @args.setter
+    def args(self, value):
+        self._template = None
+        ValueError.args.__set__(self, value)
+
+    def __str__(self):
+        self._format_template()
+        return super().__str__()
+
+    def __repr__(self):
+        self._format_template()
+        return super().__repr__()
+
+    def __reduce__(self):
+        self._format_template()
+        return super().__reduce__()
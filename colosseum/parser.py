@@ -1,5 +1,5 @@
+import re
 from ast import literal_eval
-from collections import Sequence
 
 from .colors import NAMED_COLOR, hsl, rgb
 from .exceptions import ValidationError
@@ -20,7 +20,8 @@ def units(value):
     """
     if isinstance(value, Unit):
         return value
-    elif isinstance(value, (int, float)):
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        # bool is an int subclass, but True/False are not lengths
         return value * px
     elif isinstance(value, str):
         for suffix, unit in Unit.UNITS:
@@ -38,6 +39,10 @@ def units(value):
     raise ValueError('Unknown size %s' % value)
 
 
+# '#RGB', '#RGBA', '#RRGGBB' or '#RRGGBBAA'
+_HEX_COLOR_RE = re.compile(r'#(?:[0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})')
+
+
 def color(value):
     """Parse a color from a value.
 
@@ -59,33 +64,30 @@ def color(value):
         return value
 
     elif isinstance(value, str):
-        if value[0] == '#':
-            if len(value) == 4:
-                return rgb(
-                    r=int(value[1] + value[1], 16),
-                    g=int(value[2] + value[2], 16),
-                    b=int(value[3] + value[3], 16),
-                )
-            elif len(value) == 5:
-                return rgb(
-                    r=int(value[1] + value[1], 16),
-                    g=int(value[2] + value[2], 16),
-                    b=int(value[3] + value[3], 16),
-                    a=int(value[4] + value[4], 16) / 0xff,
-                )
-            elif len(value) == 7:
-                return rgb(
-                    r=int(value[1:3], 16),
-                    g=int(value[3:5], 16),
-                    b=int(value[5:7], 16),
-                )
-            elif len(value) == 9:
-                return rgb(
-                    r=int(value[1:3], 16),
-                    g=int(value[3:5], 16),
-                    b=int(value[5:7], 16),
-                    a=int(value[7:9], 16) / 0xff,
-                )
+        if value and value[0] == '#':
+            if _HEX_COLOR_RE.fullmatch(value):
+                # The digits are validated, so convert them all at once
+                digits = int(value[1:], 16)
+                length = len(value)
+                if length == 4:
+                    # Each short form digit stands for itself repeated (0xN * 0x11)
+                    return rgb(((digits >> 8) & 0xf) * 0x11, ((digits >> 4) & 0xf) * 0x11, (digits & 0xf) * 0x11)
+                elif length == 5:
+                    return rgb(
+                        ((digits >> 12) & 0xf) * 0x11,
+                        ((digits >> 8) & 0xf) * 0x11,
+                        ((digits >> 4) & 0xf) * 0x11,
+                        (digits & 0xf) * 0x11 / 0xff,
+                    )
+                elif length == 7:
+                    return rgb((digits >> 16) & 0xff, (digits >> 8) & 0xff, digits & 0xff)
+                else:
+                    return rgb(
+                        (digits >> 24) & 0xff,
+                        (digits >> 16) & 0xff,
+                        (digits >> 8) & 0xff,
+                        (digits & 0xff) / 0xff,
+                    )
         elif value.startswith('rgba'):
             try:
                 values = value[5:-1].split(',')
@@ -139,32 +141,30 @@ def border_spacing(value):
     Parse a border spacing value.
 
     Accepts:
-    * A sequence object different that a string.
+    * A list or tuple of 1 or 2 length items.
     * An integer (interpreted as pixels).
     * A float (interpreted as pixels).
     * A string with of 1 or 2 length items separated by spaces.
     """
-    if isinstance(value, Sequence) and not isinstance(value, str):
+    # Check concrete types only; an isinstance check against an ABC is much slower
+    if isinstance(value, str):
+        values = value.split()
+    elif isinstance(value, (list, tuple)):
         values = value
-    elif isinstance(value, (int, float)):
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
         values = (value, )
     else:
-        values = [x.strip() for x in value.split()]
+        raise ValueError('Unknown border spacing %s' % str(value))
 
-    if len(values) == 1:
-        horizontal = units(values[0])
-        return BorderSpacing(horizontal)
-    elif len(values) == 2:
-        horizontal = units(values[0])
-        vertical = units(values[1])
-        return BorderSpacing(horizontal, vertical)
+    if 1 <= len(values) <= 2:
+        return BorderSpacing(*map(units, values))
 
     raise ValueError('Unknown border spacing %s' % str(value))
 
 
 def rect(value):
     """Parse a given rect shape."""
-    value = ' '.join(val.strip() for val in value.split())
+    value = ' '.join(value.split())
     if (value.startswith('rect(') and value.endswith(')') and
             value.count('rect(') == 1 and value.count(')') == 1):
         value = value.replace('rect(', '')
@@ -188,12 +188,12 @@ def quotes(value):
 
     Accepts:
     * A string: "'<' '>' '{' '}'"
-    * A sequence: ('<', '>') or ['{', '}']
+    * A list or tuple: ('<', '>') or ['{', '}']
     * A list of 2 item tuples: [('<', '>'), ('{', '}')]
     """
     if isinstance(value, str):
-        values = [val.strip() for val in value.split()]
-    elif isinstance(value, Sequence):
+        values = value.split()
+    elif isinstance(value, (list, tuple)):
         # Flatten list of tuples
         values = [repr(item) for sublist in value for item in sublist]
     else:
@@ -261,8 +261,8 @@ def outline(value):
     """
     if value:
         if isinstance(value, str):
-            values = [val.strip() for val in value.split()]
-        elif isinstance(value, Sequence):
+            values = value.split()
+        elif isinstance(value, (list, tuple)):
             values = value
         else:
             raise ValueError('Unknown outline %s ' % value)
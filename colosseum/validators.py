@@ -2,108 +2,281 @@
 Validate values of different css properties.
 """
 
+from collections import namedtuple
+from functools import lru_cache
+
 from . import parser
 from . import units
+from .colors import hsl, rgb
 from .exceptions import ValidationError
 
 
-def _numeric_validator(num_value, numeric_type, min_value, max_value):
+_COERCE_FLOAT_ERROR = 'Cannot coerce %s to float'
+_COERCE_INT_ERROR = 'Cannot coerce %s to int'
+_MIN_VALUE_ERROR = 'Value %s below minimum value %s'
+_MAX_VALUE_ERROR = 'Value %s above maximum value %s'
+_UNKNOWN_SIZE_ERROR = 'Unknown size %s'
+_NOT_PERCENT_ERROR = 'Value %s is not a Percent unit'
+_UNKNOWN_COLOR_ERROR = 'Unknown color %s'
+_NOT_RECT_ERROR = 'Value %s is not a rect shape'
+_NOT_QUOTE_ERROR = 'Value %s is not a valid quote'
+
+# Returned by the try_* validators when a value is not valid
+INVALID = object()
+
+# Everything known about a validator:
+# * description: the values it accepts, as shown in error messages
+# * try_validator: a version returning INVALID instead of raising, or None
+# * passthrough_types: types it returns unchanged
+ValidatorInfo = namedtuple('ValidatorInfo', ['description', 'try_validator', 'passthrough_types'])
+
+VALIDATOR_INFO = {}
+
+
+def register_validator(validator, description, try_validator=None, passthrough_types=()):
+    """Register the description and optional helpers of a validator."""
+    VALIDATOR_INFO[validator] = ValidatorInfo(description, try_validator, passthrough_types)
+
+
+def description_of(validator):
+    """Return the description of the values a validator accepts."""
+    try:
+        return VALIDATOR_INFO[validator].description
+    except KeyError:
+        # Unregistered validators describe themselves with a description attribute
+        return validator.description
+
+
+def passthrough_types_of(validator):
+    """Return the types a validator returns unchanged."""
+    try:
+        return VALIDATOR_INFO[validator].passthrough_types
+    except KeyError:
+        return getattr(validator, 'passthrough_types', ())
+
+
+def try_validator(validator):
+    """
+    Return a version of validator that returns INVALID instead of raising.
+
+    Validators without a dedicated non-raising version are wrapped.
+    """
+    try:
+        result = VALIDATOR_INFO[validator].try_validator
+    except KeyError:
+        result = None
+
+    if result is not None:
+        return result
+
+    def wrapped(value):
+        try:
+            return validator(value)
+        except ValidationError:
+            return INVALID
+
+    return wrapped
+
+
+def try_is_number(value):
+    """Return value as a float, or INVALID if it is not a valid float."""
+    value_type = type(value)
+    if value_type is float:
+        return value
+    elif value_type is bool:
+        # bool is an int subclass, but True/False are not CSS numbers
+        return INVALID
+
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return INVALID
+
+
+def is_number(value):
+    """Validate that value is a valid float."""
+    result = try_is_number(value)
+    if result is INVALID:
+        raise ValidationError.from_template(_COERCE_FLOAT_ERROR, value)
+
+    return result
+
+
+def try_is_integer(value):
+    """Return value as an integer, or INVALID if it is not a valid integer."""
+    value_type = type(value)
+    if value_type is int:
+        return value
+    elif value_type is bool:
+        # bool is an int subclass, but True/False are not CSS integers
+        return INVALID
+
     try:
-        num_value = numeric_type(num_value)
+        return int(value)
     except (ValueError, TypeError):
-        error_msg = "Cannot coerce {num_value} to {numeric_type}".format(
-            num_value=num_value, numeric_type=numeric_type.__name__)
-        raise ValidationError(error_msg)
+        return INVALID
 
-    if min_value is not None and num_value < min_value:
-        error_msg = 'Value {num_value} below minimum value {min_value}'.format(
-            num_value=num_value, min_value=min_value)
-        raise ValidationError(error_msg)
 
-    if max_value is not None and num_value > max_value:
-        error_msg = 'Value {num_value} above maximum value {max_value}'.format(
-            num_value=num_value, max_value=max_value)
-        raise ValidationError(error_msg)
+def is_integer(value):
+    """Validate that value is a valid integer."""
+    result = try_is_integer(value)
+    if result is INVALID:
+        raise ValidationError.from_template(_COERCE_INT_ERROR, value)
 
-    return num_value
+    return result
 
 
-def is_number(value=None, min_value=None, max_value=None):
+# Bounded validators are built once per (type, min_value, max_value) and reused
+_BOUNDED_VALIDATORS = {}
+
+
+def _bounded_validator(try_func, coerce_error, description, min_value, max_value):
     """
-    Validate that value is a valid float.
+    Build a validator for values accepted by try_func within the given range.
 
-    If min_value or max_value are provided, range checks are performed.
+    The coercion and range checks are done in the validator itself, and a
+    non-raising version is registered for Choices, so each check is a single
+    extra call on top of the coercion.
     """
+    key = (try_func, min_value, max_value)
+    try:
+        return _BOUNDED_VALIDATORS[key]
+    except KeyError:
+        pass
 
     def validator(num_value):
-        return _numeric_validator(num_value=num_value, numeric_type=float, min_value=min_value, max_value=max_value)
+        result = try_func(num_value)
+        if result is INVALID:
+            raise ValidationError.from_template(coerce_error, num_value)
 
-    if min_value is None and max_value is None:
-        return validator(value)
-    else:
-        return validator
+        if min_value is not None and result < min_value:
+            raise ValidationError.from_template(_MIN_VALUE_ERROR, result, min_value)
 
+        if max_value is not None and result > max_value:
+            raise ValidationError.from_template(_MAX_VALUE_ERROR, result, max_value)
 
-is_number.description = '<number>'
+        return result
 
+    def try_bounded_validator(num_value):
+        result = try_func(num_value)
+        if result is INVALID:
+            return INVALID
 
-def is_integer(value=None, min_value=None, max_value=None):
+        if min_value is not None and result < min_value:
+            return INVALID
+
+        if max_value is not None and result > max_value:
+            return INVALID
+
+        return result
+
+    register_validator(validator, description, try_bounded_validator)
+    _BOUNDED_VALIDATORS[key] = validator
+    return validator
+
+
+def number_validator(min_value=None, max_value=None):
     """
-    Validate that value is a valid integer.
+    Return a validator for floats within the given range.
 
-    If min_value or max_value are provided, range checks are performed.
+    Without bounds this is simply is_number.
     """
+    if min_value is None and max_value is None:
+        return is_number
 
-    def validator(num_value):
-        return _numeric_validator(num_value=num_value, numeric_type=int, min_value=min_value, max_value=max_value)
+    return _bounded_validator(try_is_number, _COERCE_FLOAT_ERROR, '<number>', min_value, max_value)
+
+
+def integer_validator(min_value=None, max_value=None):
+    """
+    Return a validator for integers within the given range.
 
+    Without bounds this is simply is_integer.
+    """
     if min_value is None and max_value is None:
-        return validator(value)
-    else:
-        return validator
+        return is_integer
 
+    return _bounded_validator(try_is_integer, _COERCE_INT_ERROR, '<integer>', min_value, max_value)
 
-is_integer.description = '<integer>'
 
+@lru_cache(maxsize=1024)
+def _parse_units_cached(value):
+    """
+    Parse a unit string, caching the result.
+
+    Stylesheets repeat the same literals (e.g. '10px') many times, and parsed
+    units are never mutated, so the same instance can safely be shared.
+    """
+    return parser.units(value)
+
+
+def try_is_length(value):
+    """Return value as a length, or INVALID if it is not a valid length."""
+    # Percent is a Unit subclass, so already converted values of both pass through
+    if isinstance(value, units.Unit):
+        return value
 
-def is_length(value):
     try:
-        value = parser.units(value)
-    except ValueError as error:
-        raise ValidationError(str(error))
+        if type(value) is str:
+            return _parse_units_cached(value)
+        return parser.units(value)
+    except ValueError:
+        return INVALID
 
-    return value
 
+def is_length(value):
+    result = try_is_length(value)
+    if result is INVALID:
+        raise ValidationError.from_template(_UNKNOWN_SIZE_ERROR, value)
 
-is_length.description = '<length>'
+    return result
 
 
-def is_percentage(value):
+def try_is_percentage(value):
+    """Return value as a percentage, or INVALID if it is not a valid percentage."""
+    if isinstance(value, units.Percent):
+        return value
+
     try:
-        value = parser.units(value)
-    except ValueError as error:
-        raise ValidationError(str(error))
+        if type(value) is str:
+            value = _parse_units_cached(value)
+        else:
+            value = parser.units(value)
+    except ValueError:
+        return INVALID
 
     if not isinstance(value, units.Percent):
-        error_msg = 'Value {value} is not a Percent unit'.format(value=value)
-        raise ValidationError(error_msg)
+        return INVALID
 
     return value
 
 
-is_percentage.description = '<percentage>'
+def is_percentage(value):
+    result = try_is_percentage(value)
+    if result is INVALID:
+        # Tell apart values that are not sizes at all from non-percent sizes
+        length = try_is_length(value)
+        if length is INVALID:
+            raise ValidationError.from_template(_UNKNOWN_SIZE_ERROR, value)
+        raise ValidationError.from_template(_NOT_PERCENT_ERROR, length)
 
+    return result
 
-def is_color(value):
+
+def try_is_color(value):
+    """Return value as a color, or INVALID if it is not a valid color."""
     try:
-        value = parser.color(value)
-    except ValueError as error:
-        raise ValidationError(str(error))
+        return parser.color(value)
+    except ValueError:
+        return INVALID
 
-    return value
 
+def is_color(value):
+    result = try_is_color(value)
+    if result is INVALID:
+        raise ValidationError.from_template(_UNKNOWN_COLOR_ERROR, value)
 
-is_color.description = '<color>'
+    return result
 
 
 def is_border_spacing(value):
@@ -115,35 +288,37 @@ def is_border_spacing(value):
     try:
         value = parser.border_spacing(value)
     except ValueError as error:
-        raise ValidationError(str(error))
+        raise ValidationError(str(error)) from None
 
     return value
 
 
-is_border_spacing.description = '<length> <length>?'
-
-
 def is_rect(value):
     """Check if given value is a rect shape and return it."""
     try:
         value = parser.rect(value)
     except ValueError:
-        raise ValidationError('Value {value} is not a rect shape'.format(value=value))
+        raise ValidationError.from_template(_NOT_RECT_ERROR, value) from None
 
     return value
 
 
-is_rect.description = '<rect>'
-
-
 def is_quote(value):
     """Check if given value is of content quotes and return it."""
     try:
         value = parser.quotes(value)
     except ValueError:
-        raise ValidationError('Value {value} is not a valid quote'.format(value=value))
+        raise ValidationError.from_template(_NOT_QUOTE_ERROR, value) from None
 
     return value
 
 
-is_quote.description = '[<string> <string>]+'
+# Percent is a Unit subclass, so is_length passes through both
+register_validator(is_number, '<number>', try_is_number)
+register_validator(is_integer, '<integer>', try_is_integer)
+register_validator(is_length, '<length>', try_is_length, (units.Unit, ))
+register_validator(is_percentage, '<percentage>', try_is_percentage, (units.Percent, ))
+register_validator(is_color, '<color>', try_is_color, (rgb, hsl))
+register_validator(is_border_spacing, '<length> <length>?')
+register_validator(is_rect, '<rect>')
+register_validator(is_quote, '[<string> <string>]+')
@@ -2,13 +2,14 @@ from unittest import TestCase
 
 from colosseum import engine as css_engine
 from colosseum.colors import GOLDENROD, NAMED_COLOR, REBECCAPURPLE
-from colosseum.constants import (AUTO, BLOCK, INHERIT, INITIAL, INLINE, LEFT,
-                                 REVERT, RIGHT, RTL, TABLE, UNSET, Choices,
-                                 OtherProperty)
+from colosseum.constants import (AUTO, BLOCK, INHERIT, INITIAL, INLINE,
+                                 INVERT, LEFT, REVERT, RIGHT, RTL, SOLID,
+                                 TABLE, UNSET, Choices, OtherProperty)
 from colosseum.declaration import CSS, validated_property
+from colosseum.exceptions import ValidationError
 from colosseum.units import percent, px
 from colosseum.validators import (is_color, is_integer, is_length, is_number,
-                                  is_percentage)
+                                  is_percentage, passthrough_types_of)
 from colosseum.wrappers import BorderSpacing, Quotes
 
 from .utils import TestNode
@@ -186,6 +187,57 @@ class PropertyChoiceTests(TestCase):
                 "Invalid value 'invalid' for CSS property 'prop'; Valid values are: <color>"
             )
 
+    def test_unchanged_passthrough_value_skips_validation(self):
+        calls = []
+
+        def counting_is_length(value):
+            calls.append(value)
+            return is_length(value)
+
+        counting_is_length.description = '<length>'
+        counting_is_length.passthrough_types = passthrough_types_of(is_length)
+
+        class MyObject:
+            prop = validated_property('prop', choices=Choices(validators=[counting_is_length]), initial=0)
+
+        obj = MyObject()
+        calls.clear()
+
+        # Same value as the current one; the validator is not called
+        obj.prop = 0 * px
+        self.assertEqual(calls, [])
+
+        # A new value is validated
+        obj.prop = 10 * px
+        self.assertEqual(calls, [10 * px])
+
+        # Values that need conversion are always validated
+        obj.prop = '10px'
+        self.assertEqual(calls, [10 * px, '10px'])
+
+    def test_unregistered_validator(self):
+        def is_custom(value):
+            if value != 'custom':
+                raise ValidationError('Not custom')
+            return value
+
+        is_custom.description = '<custom>'
+
+        class MyObject:
+            prop = validated_property('prop', choices=Choices(validators=[is_custom]), initial='custom')
+
+        obj = MyObject()
+        obj.prop = 'custom'
+
+        try:
+            obj.prop = 'invalid'
+            self.fail('Should raise ValueError')
+        except ValueError as v:
+            self.assertEqual(
+                str(v),
+                "Invalid value 'invalid' for CSS property 'prop'; Valid values are: <custom>"
+            )
+
     def test_values(self):
         class MyObject:
             prop = validated_property('prop', choices=Choices('a', 'b', None), initial='a')
@@ -218,6 +270,21 @@ class PropertyChoiceTests(TestCase):
                 "Invalid value 'invalid' for CSS property 'prop'; Valid values are: a, b, none"
             )
 
+    def test_choices_constants(self):
+        choices = Choices(0, AUTO, None, explicit_defaulting_constants=[INHERIT])
+
+        self.assertIs(choices.validate('auto'), AUTO)
+        self.assertIsNone(choices.validate('none'))
+        self.assertEqual(choices.validate(INHERIT), INHERIT)
+
+        # Unhashable values are compared against each constant
+        self.assertEqual(choices.validate(0 * px), 0)
+        with self.assertRaises(ValueError):
+            choices.validate(['auto'])
+
+        with self.assertRaises(ValueError):
+            choices.validate('invalid')
+
     def test_all_choices(self):
         class MyObject:
             prop = validated_property('prop', choices=Choices(
@@ -254,6 +321,14 @@ class PropertyChoiceTests(TestCase):
                 "a, b, inherit, initial, none, revert, unset"
             )
 
+    def test_bool_is_not_a_number_or_length(self):
+        choices = Choices(AUTO, validators=[is_integer, is_number, is_length, is_percentage, is_color])
+
+        with self.assertRaises(ValueError):
+            choices.validate(True)
+        with self.assertRaises(ValueError):
+            choices.validate(False)
+
     def test_string_symbol(self):
         class MyObject:
             prop = validated_property('prop', choices=Choices(AUTO, None), initial=None)
@@ -770,6 +845,54 @@ class CssDeclarationTests(TestCase):
 
         self.assertFalse(node.style.dirty)
 
+        # A non-property prevents the other properties from being set
+        with self.assertRaises(NameError):
+            node.style.update(width=30, not_a_property=10)
+
+        self.assertEqual(node.style.width, AUTO)
+        self.assertFalse(node.style.dirty)
+
+        # An invalid value prevents the other properties from being set
+        with self.assertRaises(ValueError):
+            node.style.update(width=30, height='bogus')
+
+        self.assertEqual(node.style.width, AUTO)
+        self.assertEqual(node.style.height, 20)
+        self.assertFalse(node.style.dirty)
+
+        # ... including the values of directional and shorthand properties
+        with self.assertRaises(ValueError):
+            node.style.update(margin=(10, 'bogus'))
+
+        with self.assertRaises(ValueError):
+            node.style.update(width=30, outline='bogus')
+
+        self.assertEqual(node.style.margin, (0, 0, 0, 0))
+        self.assertEqual(node.style.width, AUTO)
+        self.assertFalse(node.style.dirty)
+
+        # Directional and shorthand properties set their individual properties
+        node.style.update(margin=(10, 20), outline='1px solid')
+
+        self.assertEqual(node.style.margin, (10, 20, 10, 20))
+        self.assertEqual(node.style.outline_width, 1)
+        self.assertEqual(node.style.outline_style, SOLID)
+        self.assertEqual(node.style.outline_color, INVERT)
+        self.assertTrue(node.style.dirty)
+
+        # Setting the same values again doesn't dirty the layout
+        node.layout.dirty = False
+        node.style.update(margin=(10, 20), outline='1px solid')
+
+        self.assertFalse(node.style.dirty)
+
+        # Clearing a directional or shorthand property resets its individual properties
+        node.style.update(margin=None, outline=None)
+
+        self.assertEqual(node.style.margin, (0, 0, 0, 0))
+        self.assertIsNone(node.style.outline_style)
+        self.assertTrue(node.style.dirty)
+
     def test_other_property_valid(self):
         class MyObject:
             prop = validated_property('prop', choices=Choices(AUTO, None), initial=OtherProperty('other_prop'))
@@ -62,6 +62,10 @@ class ParseUnitTests(TestCase):
         with self.assertRaises(ValueError):
             parser.units('church')
 
+        # bool is an int subclass, but not a length
+        with self.assertRaises(ValueError):
+            parser.units(True)
+
 
 class ParseColorTests(TestCase):
     def assertEqualHSL(self, value, expected):
@@ -191,6 +195,19 @@ class ParseColorTests(TestCase):
         with self.assertRaises(ValueError):
             parser.color('not a color')
 
+    def test_invalid_hex(self):
+        with self.assertRaises(ValueError):
+            parser.color('#12')
+
+        with self.assertRaises(ValueError):
+            parser.color('#ggg')
+
+        with self.assertRaises(ValueError):
+            parser.color('#1122334')
+
+        with self.assertRaises(ValueError):
+            parser.color('')
+
 
 class ParseRectTests(TestCase):
 
@@ -1,9 +1,14 @@
+import pickle
 from unittest import TestCase
 
 from colosseum.shapes import Rect
-from colosseum.units import px
-from colosseum.validators import (ValidationError, is_border_spacing,
-                                  is_integer, is_number, is_quote, is_rect)
+from colosseum.units import percent, px
+from colosseum.validators import (INVALID, ValidationError, description_of,
+                                  integer_validator, is_border_spacing,
+                                  is_color, is_integer, is_length, is_number,
+                                  is_percentage, is_quote, is_rect,
+                                  number_validator, try_is_integer,
+                                  try_is_length, try_validator)
 from colosseum.wrappers import Quotes
 
 
@@ -12,7 +17,7 @@ class NumericTests(TestCase):
     def test_integer(self):
         self.assertEqual(is_integer('1'), 1)
 
-        validator = is_integer(min_value=0, max_value=12)
+        validator = integer_validator(min_value=0, max_value=12)
         self.assertEqual(validator('1'), 1)
         self.assertEqual(validator('0'), 0)
         self.assertEqual(validator('12'), 12)
@@ -29,7 +34,7 @@ class NumericTests(TestCase):
     def test_number(self):
         self.assertEqual(is_number('1'), 1.0)
 
-        validator = is_number(min_value=0, max_value=12)
+        validator = number_validator(min_value=0, max_value=12)
         self.assertEqual(validator('1.0'), 1.0)
         self.assertEqual(validator('0.0'), 0.0)
         self.assertEqual(validator('12.0'), 12.0)
@@ -43,6 +48,128 @@ class NumericTests(TestCase):
         with self.assertRaises(ValidationError):
             validator('spam')
 
+    def test_error_without_template(self):
+        self.assertEqual(str(ValidationError('message')), 'message')
+        self.assertEqual(str(ValidationError('a', 'b')), "('a', 'b')")
+
+    def test_error_template_args(self):
+        with self.assertRaises(ValidationError) as context:
+            is_integer('spam')
+
+        self.assertEqual(context.exception.args, ('Cannot coerce spam to int', ))
+        self.assertEqual(repr(context.exception), "ValidationError('Cannot coerce spam to int')")
+
+        with self.assertRaises(ValidationError) as context:
+            is_integer('eggs')
+
+        # Formatted on first access, whichever comes first
+        self.assertEqual(repr(context.exception), "ValidationError('Cannot coerce eggs to int')")
+        self.assertEqual(str(context.exception), 'Cannot coerce eggs to int')
+
+    def test_error_template_pickle(self):
+        with self.assertRaises(ValidationError) as context:
+            is_integer('spam')
+
+        error = pickle.loads(pickle.dumps(context.exception))
+        self.assertEqual(error.args, ('Cannot coerce spam to int', ))
+
+    def test_error_template_with_tuple_value(self):
+        with self.assertRaisesRegex(ValidationError, r'^Cannot coerce \(1, 2\) to int$'):
+            is_integer((1, 2))
+
+    def test_bool(self):
+        with self.assertRaises(ValidationError):
+            is_integer(True)
+
+        with self.assertRaises(ValidationError):
+            is_number(False)
+
+    def test_error_message(self):
+        with self.assertRaisesRegex(ValidationError, '^Cannot coerce spam to int$'):
+            is_integer('spam')
+
+        with self.assertRaisesRegex(ValidationError, r'^Value -2.0 below minimum value 0$'):
+            number_validator(min_value=0)(-2)
+
+        with self.assertRaisesRegex(ValidationError, r'^Value 15 above maximum value 12$'):
+            integer_validator(max_value=12)(15)
+
+    def test_bounded_validator_reused(self):
+        self.assertIs(integer_validator(min_value=0), integer_validator(min_value=0))
+        self.assertIs(number_validator(min_value=0, max_value=1), number_validator(min_value=0, max_value=1))
+        self.assertIsNot(integer_validator(min_value=0), number_validator(min_value=0))
+        self.assertIsNot(integer_validator(min_value=0), integer_validator(min_value=1))
+
+    def test_description(self):
+        self.assertEqual(description_of(is_integer), '<integer>')
+        self.assertEqual(description_of(integer_validator(min_value=0)), '<integer>')
+        self.assertEqual(description_of(number_validator(max_value=1)), '<number>')
+
+    def test_unbounded_validator(self):
+        self.assertIs(integer_validator(), is_integer)
+        self.assertIs(number_validator(), is_number)
+
+
+class UnitTests(TestCase):
+
+    def test_length(self):
+        self.assertEqual(is_length('10px'), 10 * px)
+        self.assertEqual(is_length('10%'), 10 * percent)
+        self.assertEqual(is_length(10), 10 * px)
+
+        # Repeated strings return the same parsed instance
+        self.assertIs(is_length('12px'), is_length('12px'))
+
+        with self.assertRaises(ValidationError):
+            is_length('spam')
+
+    def test_percentage(self):
+        self.assertEqual(is_percentage('10%'), 10 * percent)
+
+        with self.assertRaises(ValidationError):
+            is_percentage('10px')
+
+    def test_messages(self):
+        with self.assertRaisesRegex(ValidationError, '^Unknown size spam$'):
+            is_length('spam')
+
+        with self.assertRaisesRegex(ValidationError, '^Unknown size spam$'):
+            is_percentage('spam')
+
+        with self.assertRaisesRegex(ValidationError, '^Value 10px is not a Percent unit$'):
+            is_percentage('10px')
+
+        with self.assertRaisesRegex(ValidationError, '^Value 10px is not a Percent unit$'):
+            is_percentage(10)
+
+        with self.assertRaisesRegex(ValidationError, '^Unknown color spam$'):
+            is_color('spam')
+
+
+class TryValidatorTests(TestCase):
+
+    def test_try_validator(self):
+        self.assertEqual(try_is_integer('1'), 1)
+        self.assertIs(try_is_integer('spam'), INVALID)
+        self.assertEqual(try_is_length('10px'), 10 * px)
+        self.assertIs(try_is_length('spam'), INVALID)
+
+    def test_dedicated_version(self):
+        self.assertIs(try_validator(is_integer), try_is_integer)
+        self.assertIs(try_validator(is_length), try_is_length)
+
+    def test_bounded_version(self):
+        validator = try_validator(integer_validator(min_value=0, max_value=12))
+        self.assertEqual(validator('12'), 12)
+        self.assertIs(validator(-2), INVALID)
+        self.assertIs(validator(15), INVALID)
+        self.assertIs(validator('spam'), INVALID)
+
+    def test_wrapped_version(self):
+        validator = try_validator(is_rect)
+        self.assertEqual(validator('rect(1px, 3px, 2px, 4px)'), Rect(1, 3, 2, 4))
+        self.assertIs(validator('spam'), INVALID)
+
 
 class BorderSpacingTests(TestCase):
 
@@ -62,6 +189,13 @@ class BorderSpacingTests(TestCase):
         self.assertEqual(is_border_spacing('  1  2  ').horizontal, 1 * px)
         self.assertEqual(is_border_spacing('  1  2  ').vertical, 2 * px)
 
+    def test_border_spacing_valid_str_subclass(self):
+        class CSSString(str):
+            pass
+
+        self.assertEqual(is_border_spacing(CSSString('1px 2px')).horizontal, 1 * px)
+        self.assertEqual(is_border_spacing(CSSString('1px 2px')).vertical, 2 * px)
+
     def test_border_spacing_valid_int_1_item(self):
         self.assertEqual(is_border_spacing(1).horizontal, 1 * px, )
         self.assertEqual(is_border_spacing(1).vertical, 1 * px, )
@@ -109,6 +243,26 @@ class BorderSpacingTests(TestCase):
         with self.assertRaises(ValidationError):
             is_border_spacing(('a', 'b'))
 
+    def test_border_spacing_invalid_type(self):
+        with self.assertRaises(ValidationError):
+            is_border_spacing(None)
+
+        with self.assertRaises(ValidationError):
+            is_border_spacing({1: 2})
+
+    def test_border_spacing_invalid_not_chained(self):
+        with self.assertRaises(ValidationError) as context:
+            is_border_spacing('a a')
+
+        self.assertTrue(context.exception.__suppress_context__)
+
+    def test_border_spacing_invalid_bool(self):
+        with self.assertRaises(ValidationError):
+            is_border_spacing(True)
+
+        with self.assertRaises(ValidationError):
+            is_border_spacing([1, False])
+
     def test_border_spacing_invalid_length_str_0_items(self):
         with self.assertRaises(ValidationError):
             is_border_spacing('')